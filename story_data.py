@@ -0,0 +1,177 @@
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
+
+QUIT_LINE = "  Q. Quit the adventure\n"
+
+
+@dataclass(frozen=True, slots=True)
+class Choice:
+    key: str
+    description: str
+    target: str
+
+
+@dataclass(frozen=True, slots=True)
+class StoryNode:
+    title: str
+    text: str
+    choices: Tuple[Choice, ...]
+    choices_by_key: Mapping[str, Choice] = field(init=False, repr=False, compare=False)
+    menu: str = field(init=False, repr=False, compare=False)
+    header: str = field(init=False, repr=False, compare=False)
+    rendered: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen dataclass: derived fields have to bypass __setattr__.
+        # Keys are registered in both cases so raw input can be looked up without upper().
+        # Read-only view, since nodes live in the process-wide _STORY graph.
+        object.__setattr__(
+            self,
+            "choices_by_key",
+            MappingProxyType({k: c for c in self.choices for k in (c.key.upper(), c.key.lower())}),
+        )
+        object.__setattr__(self, "menu", "".join(f"  {c.key}. {c.description}\n" for c in self.choices))
+        object.__setattr__(self, "header", f"\n== {self.title} ==\n{self.text}\n\n")
+        object.__setattr__(self, "rendered", self.header + self.menu + QUIT_LINE)
+
+
+# The story graph is static, so it is built once at import and shared by every run.
+_STORY: Dict[str, StoryNode] = {
+    "offer": StoryNode(
+        title="The Offer Letter",
+        text=(
+            "Eli Klunder just graduated from Michigan State University. "
+            "The Circa Management Trainee program in Las Vegas sent an offer. "
+            "Does he accept and start packing for the desert, or stay in Michigan?"
+        ),
+        choices=(
+            Choice("1", "Accept the job offer and chase the Vegas adventure", "travel_method"),
+            Choice("2", "Stay in Michigan and postpone the move", "stay_home"),
+        ),
+    ),
+    "stay_home": StoryNode(
+        title="Staying Put",
+        text=(
+            "Eli keeps his Spartan roots in Michigan for now. The Strip will have to wait, "
+            "but the Circa team sends a friendly note encouraging him to reapply later."
+        ),
+        choices=(),
+    ),
+    "travel_method": StoryNode(
+        title="Planning the Move",
+        text=(
+            "With the offer accepted, Eli must choose how to travel west. A road trip offers "
+            "open highways, but a flight would get him to training faster."
+        ),
+        choices=(
+            Choice("1", "Drive cross-country with playlists and podcasts", "drive_prep"),
+            Choice("2", "Fly to Las Vegas and ship the essentials", "fly_prep"),
+        ),
+    ),
+    "drive_prep": StoryNode(
+        title="Packing the Car",
+        text=(
+            "Eli loads his hatchback. He can overpack with souvenirs from East Lansing or travel "
+            "light to keep the car nimble over the Rockies."
+        ),
+        choices=(
+            Choice("1", "Pack heavy: memorabilia, winter coats, and gadgets", "midwest_leg"),
+            Choice("2", "Minimalist: only essentials and a lucky MSU pennant", "midwest_leg"),
+        ),
+    ),
+    "midwest_leg": StoryNode(
+        title="Crossing the Midwest",
+        text=(
+            "The Michigan sunsets fade in the rearview. Eli approaches Chicago and debates a detour."
+        ),
+        choices=(
+            Choice("1", "Stop in Chicago for deep dish and a skyline photo", "great_plains"),
+            Choice("2", "Push straight through toward the Great Plains", "great_plains"),
+        ),
+    ),
+    "great_plains": StoryNode(
+        title="Great Plains Night",
+        text=(
+            "Nebraska's open skies stretch for miles. The road hums under Eli's tires."
+        ),
+        choices=(
+            Choice("1", "Camp under the stars to recharge", "rockies"),
+            Choice("2", "Drive overnight with neon podcasts", "rockies"),
+        ),
+    ),
+    "rockies": StoryNode(
+        title="Rocky Mountain Pass",
+        text=(
+            "Mountain air greets Eli near Denver. He must choose between speed and scenery."
+        ),
+        choices=(
+            Choice("1", "Take the scenic route through mountain towns", "vegas_arrival"),
+            Choice("2", "Stick to the interstate to arrive ahead of schedule", "vegas_arrival"),
+        ),
+    ),
+    "fly_prep": StoryNode(
+        title="Booking the Flight",
+        text=(
+            "A one-way ticket from Detroit to Las Vegas pops up with a layover in Denver. Eli "
+            "balances cost against comfort for the big leap."
+        ),
+        choices=(
+            Choice("1", "Choose the cheap redeye and nap on the plane", "airport_wait"),
+            Choice("2", "Pick the daytime flight with a window seat", "airport_wait"),
+        ),
+    ),
+    "airport_wait": StoryNode(
+        title="Airport Vibes",
+        text=(
+            "Suitcase tagged for LAS, Eli has time before boarding. He can grind through onboarding paperwork "
+            "or explore the terminal."
+        ),
+        choices=(
+            Choice("1", "Finish Circa onboarding modules early", "vegas_arrival"),
+            Choice("2", "Chat with fellow travelers about Vegas tips", "vegas_arrival"),
+        ),
+    ),
+    "vegas_arrival": StoryNode(
+        title="Welcome to Las Vegas",
+        text=(
+            "After miles or miles above the clouds, the Strip's glow rises. Circa's Management Trainee program "
+            "begins Monday, but Eli has the weekend to settle in and choose his vibe."
+        ),
+        choices=(
+            Choice("1", "Explore Fremont Street with new teammates", "first_weekend"),
+            Choice("2", "Spend a quiet evening organizing his apartment", "first_weekend"),
+        ),
+    ),
+    "first_weekend": StoryNode(
+        title="First Weekend Decisions",
+        text=(
+            "Eli's choices set the tone for his Vegas chapter. The city is wide open, and the Circa team is ready."
+        ),
+        choices=(
+            Choice("1", "Celebrate with a rooftop view and envision the career ahead", "ending_rooftop"),
+            Choice("2", "Take a sunrise jog on the Strip to center himself", "ending_sunrise"),
+        ),
+    ),
+    "ending_rooftop": StoryNode(
+        title="Rooftop Resolve",
+        text=(
+            "Music and neon spill across the skyline. Eli toasts to the Circa program, feeling ready to learn, lead, "
+            "and represent his Spartan grit in a new city."
+        ),
+        choices=(),
+    ),
+    "ending_sunrise": StoryNode(
+        title="Sunrise Focus",
+        text=(
+            "Cool desert air and sunrise colors calm his nerves. The Management Trainee badge sits on his desk, "
+            "waiting for Monday's first briefing."
+        ),
+        choices=(),
+    ),
+}
+
+
+def build_story() -> Dict[str, StoryNode]:
+    """Return the shared story graph. Callers must treat it as read-only."""
+    return _STORY